@@ -1,13 +1,44 @@
+import atexit
+import numpy as np
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 import logging
 import os
+import random
+import threading
 import time
 import html
 from typing import Dict, List, Optional
 import xml.etree.ElementTree as ET
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from io import BytesIO
+from itertools import islice
+from urllib.parse import urlparse
+
+try:
+    from lxml import etree as lxml_etree
+except ImportError:  # pragma: no cover - fall back to stdlib parsing
+    lxml_etree = None
 
 logger = logging.getLogger(__name__)
 
+# Bound once so the RSS item loop skips repeated module attribute lookups
+_unescape = html.unescape
+
+def _clean_text(text: str) -> str:
+    # Strip first so only the trimmed run goes through the entity scanner
+    return _unescape(text.strip())
+
+# Numeric columns the leaderboard/dashboard views sort on
+_SORTABLE_FIELDS = (
+    'price_change_percentage_24h',
+    'price_change_percentage_7d_in_currency',
+    'total_volume',
+)
+
 class CryptoAPIService:
     def __init__(self):
         self.coingecko_base_url = "https://api.coingecko.com/api/v3"
@@ -17,212 +48,471 @@ class CryptoAPIService:
         self.opensea_api_key = os.getenv("OPENSEA_API_KEY", "")
         self.fear_greed_url = "https://api.alternative.me/fng"
 
-        # ----- Cache for endpoints -----
-        self._cache = {}
+        # ----- Shared HTTP session (connection reuse across calls) -----
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=32, max_retries=0)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        # Compressed transfers; some feeds reject requests with no/default UA
+        self._session.headers.update({
+            "Accept-Encoding": "gzip, deflate",
+            "User-Agent": "CryptoDash/1.0",
+        })
+
+        # ----- Worker pool for fan-out (kept warm across requests) -----
+        self._executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="cryptoapi")
+
+        # ----- Per-host cap on in-flight requests (avoid self-induced 429s) -----
+        self._host_sems = defaultdict(lambda: threading.BoundedSemaphore(6))
+
+        # ----- Cache for endpoints (bounded, entries expire lazily on lookup) -----
         self._cache_expiry = 300  # 5 minutes
+        self._negative_ttl = 30  # short window for empty/failed upstream results
+        self._cache_maxsize = 512
+        self._cache = {}  # key -> (data, expires_at, etag, last_modified); expiry on the monotonic clock
+        self._cache_lock = threading.Lock()  # guards writes/eviction; reads are atomic dict lookups
+
+        # ----- Column arrays + sort orders for top-coin views, keyed by (limit, page) -----
+        # (limit, page) comes from request args, so these are capped like the main cache
+        self._top_coins_columns = {}
+        self._sort_orders = {}
+        self._columns_maxsize = 32
+        self._columns_lock = threading.Lock()
+
+        # ----- In-flight fetches, for coalescing concurrent identical misses -----
+        self._inflight = {}
+        self._inflight_lock = threading.Lock()
+
+        # ----- Per-feed validators for conditional RSS GETs: url -> (etag, last_modified, articles) -----
+        self._rss_validators = {}
 
     # ----------- Internal Request with Retry -----------
-    def _safe_request(self, url: str, params: dict = None, headers: dict = None, max_retries: int = 3) -> Optional[dict]:
+    def _backoff(self, attempt: int) -> float:
+        # Exponential backoff with jitter so concurrent clients don't retry in lockstep
+        return min((0.5 * (2 ** attempt)) + random.uniform(0, 0.5), 30)
+
+    @staticmethod
+    def _conditional_headers(etag, last_modified, headers=None):
+        headers = dict(headers or {})
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        return headers
+
+    def _safe_request(self, url: str, params: dict = None, headers: dict = None, max_retries: int = 4,
+                      validators: tuple = None, response_meta: dict = None) -> Optional[dict]:
+        if validators:
+            headers = self._conditional_headers(validators[0], validators[1], headers)
         for attempt in range(max_retries):
             try:
-                response = requests.get(url, params=params, headers=headers, timeout=10)
+                with self._host_sems[urlparse(url).netloc]:
+                    response = self._session.get(url, params=params, headers=headers, timeout=10)
+                if response.status_code == 304:
+                    # Upstream unchanged; caller reuses its stale payload
+                    if response_meta is not None:
+                        response_meta["not_modified"] = True
+                    return None
                 if response.status_code == 429:
-                    wait = 2 * (attempt + 1)
-                    logger.warning(f"Rate limited (429). Retrying in {wait}s...")
+                    retry_after = response.headers.get("Retry-After")
+                    try:
+                        wait = min(float(retry_after), 30) if retry_after else self._backoff(attempt)
+                    except ValueError:
+                        wait = self._backoff(attempt)
+                    logger.warning(f"Rate limited (429). Retrying in {wait:.1f}s...")
                     time.sleep(wait)
                     continue
                 response.raise_for_status()
-                return response.json()
+                if response_meta is not None:
+                    response_meta["etag"] = response.headers.get("ETag")
+                    response_meta["last_modified"] = response.headers.get("Last-Modified")
+                return orjson.loads(response.content)
             except Exception as e:
                 logger.error(f"Error fetching {url}: {e}")
-                time.sleep(1)
+                time.sleep(self._backoff(attempt))
         return {}
 
+    # ----------- Concurrency Helper -----------
+    def gather(self, *calls):
+        """Run independent zero-arg callables concurrently, returning results in call order."""
+        if len(calls) == 1:
+            return [calls[0]()]
+        futures = [self._executor.submit(call) for call in calls]
+        return [future.result() for future in futures]
+
     # ----------- Cache Helpers -----------
     def _get_cache(self, key):
         entry = self._cache.get(key)
-        if entry and time.time() - entry['time'] < self._cache_expiry:
-            return entry['data']
+        if entry is not None and entry[1] > time.monotonic():
+            return entry[0]
         return None
 
-    def _set_cache(self, key, data):
-        self._cache[key] = {'data': data, 'time': time.time()}
+    def _get_stale(self, key):
+        """Full entry (data, expires_at, etag, last_modified), even if expired."""
+        return self._cache.get(key)
+
+    def _set_cache(self, key, data, ttl=None, etag=None, last_modified=None):
+        with self._cache_lock:
+            if key not in self._cache and len(self._cache) >= self._cache_maxsize:
+                self._evict_cache()
+            expires_at = time.monotonic() + (ttl if ttl is not None else self._cache_expiry)
+            self._cache[key] = (data, expires_at, etag, last_modified)
+
+    def _coalesce(self, key, fetch):
+        """Run fetch() once per cold cache key: the first caller does the work
+        (including the _set_cache), concurrent callers wait and reuse its result."""
+        with self._inflight_lock:
+            event = self._inflight.get(key)
+            if event is None:
+                event = threading.Event()
+                self._inflight[key] = event
+                is_leader = True
+            else:
+                is_leader = False
+
+        if not is_leader:
+            event.wait(timeout=15)
+            cached = self._get_cache(key)
+            if cached is not None:
+                return cached
+            # Leader failed or timed out; fetch independently
+            return fetch()
+
+        try:
+            return fetch()
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+            event.set()
+
+    def _evict_cache(self):
+        # Caller holds _cache_lock.
+        # Drop expired entries first; if none have expired, drop the soonest to expire
+        now = time.monotonic()
+        for key in [k for k, entry in self._cache.items() if entry[1] <= now]:
+            del self._cache[key]
+        if len(self._cache) >= self._cache_maxsize:
+            del self._cache[min(self._cache, key=lambda k: self._cache[k][1])]
 
     # ----------- CoinGecko Methods -----------
     def get_trending_coins(self) -> List[Dict]:
         cache_key = "trending_coins"
         cached = self._get_cache(cache_key)
-        if cached:
+        if cached is not None:
             return cached
 
-        data = self._safe_request(f"{self.coingecko_base_url}/search/trending") or {}
-        coins = data.get('coins', [])
-        self._set_cache(cache_key, coins)
-        return coins
+        def fetch():
+            data = self._safe_request(f"{self.coingecko_base_url}/search/trending") or {}
+            coins = data.get('coins', [])
+            self._set_cache(cache_key, coins, ttl=None if coins else self._negative_ttl)
+            return coins
+
+        return self._coalesce(cache_key, fetch)
 
     def get_coin_prices(self, coin_ids: List[str], vs_currency: str = 'usd') -> Dict:
         cache_key = f"coin_prices_{'_'.join(coin_ids)}_{vs_currency}"
         cached = self._get_cache(cache_key)
-        if cached:
+        if cached is not None:
             return cached
 
-        ids_str = ','.join(coin_ids)
-        params = {
-            'ids': ids_str,
-            'vs_currencies': vs_currency,
-            'include_24hr_change': 'true',
-            'include_market_cap': 'true',
-            'include_24hr_vol': 'true'
-        }
-        data = self._safe_request(f"{self.coingecko_base_url}/simple/price", params=params) or {}
-        self._set_cache(cache_key, data)
-        return data
+        def fetch():
+            params = {
+                'ids': ','.join(coin_ids),
+                'vs_currencies': vs_currency,
+                'include_24hr_change': 'true',
+                'include_market_cap': 'true',
+                'include_24hr_vol': 'true'
+            }
+            data = self._safe_request(f"{self.coingecko_base_url}/simple/price", params=params) or {}
+            self._set_cache(cache_key, data, ttl=None if data else self._negative_ttl)
+            return data
+
+        return self._coalesce(cache_key, fetch)
 
     def get_top_coins(self, limit: int = 100, page: int = 1) -> List[Dict]:
         cache_key = f"top_coins_{limit}_{page}"
         cached = self._get_cache(cache_key)
-        if cached:
+        if cached is not None:
             return cached
 
-        params = {
-            'vs_currency': 'usd',
-            'order': 'market_cap_desc',
-            'per_page': limit,
-            'page': page,
-            'sparkline': 'false',
-            'price_change_percentage': '24h,7d'
+        def fetch():
+            params = {
+                'vs_currency': 'usd',
+                'order': 'market_cap_desc',
+                'per_page': limit,
+                'page': page,
+                'sparkline': 'false',
+                'price_change_percentage': '24h,7d'
+            }
+            stale = self._get_stale(cache_key)
+            meta = {}
+            data = self._safe_request(f"{self.coingecko_base_url}/coins/markets", params=params,
+                                      validators=stale[2:4] if stale else None,
+                                      response_meta=meta) or []
+            if meta.get("not_modified") and stale is not None:
+                # Unchanged upstream: reuse the stale payload and extend its expiry
+                self._set_cache(cache_key, stale[0], etag=stale[2], last_modified=stale[3])
+                return stale[0]
+            self._index_top_coins((limit, page), data)
+            self._set_cache(cache_key, data, ttl=None if data else self._negative_ttl,
+                            etag=meta.get("etag"), last_modified=meta.get("last_modified"))
+            return data
+
+        return self._coalesce(cache_key, fetch)
+
+    def _index_top_coins(self, key, coins):
+        # One contiguous float column per sortable field, rebuilt on each refetch
+        columns = {
+            field: np.array([coin.get(field) or 0 for coin in coins], dtype=np.float64)
+            for field in _SORTABLE_FIELDS
         }
-        data = self._safe_request(f"{self.coingecko_base_url}/coins/markets", params=params) or []
-        self._set_cache(cache_key, data)
-        return data
+        with self._columns_lock:
+            if key not in self._top_coins_columns and len(self._top_coins_columns) >= self._columns_maxsize:
+                # Cheap to rebuild on demand, so just start over when the cap is hit
+                self._top_coins_columns.clear()
+                self._sort_orders.clear()
+            self._top_coins_columns[key] = columns
+            for order_key in [k for k in self._sort_orders if k[:2] == key]:
+                del self._sort_orders[order_key]
+
+    def get_top_coins_sorted(self, sort_field: str, limit: int = 100, page: int = 1) -> List[Dict]:
+        coins = self.get_top_coins(limit, page)
+        if not coins:
+            return coins
+        with self._columns_lock:
+            columns = self._top_coins_columns.get((limit, page))
+            column = columns.get(sort_field) if columns is not None else None
+        if column is None or len(column) != len(coins):
+            return sorted(coins, key=lambda c: c.get(sort_field) or 0, reverse=True)
+        order_key = (limit, page, sort_field)
+        with self._columns_lock:
+            order = self._sort_orders.get(order_key)
+        if order is None:
+            order = np.argsort(-column, kind='stable')
+            with self._columns_lock:
+                self._sort_orders[order_key] = order
+        return [coins[i] for i in order]
 
     def search_coins(self, query: str) -> Dict:
         cache_key = f"search_coins_{query}"
         cached = self._get_cache(cache_key)
-        if cached:
+        if cached is not None:
             return cached
 
-        data = self._safe_request(f"{self.coingecko_base_url}/search", params={'query': query}) or {}
-        self._set_cache(cache_key, data)
-        return data
+        def fetch():
+            data = self._safe_request(f"{self.coingecko_base_url}/search", params={'query': query}) or {}
+            self._set_cache(cache_key, data, ttl=None if data else self._negative_ttl)
+            return data
+
+        return self._coalesce(cache_key, fetch)
 
     # ----------- Charts (Coin History) -----------
     def get_coin_history(self, coin_symbol: str, days: int = 30) -> Dict:
         cache_key = f"history_{coin_symbol}_{days}"
         cached = self._get_cache(cache_key)
-        if cached:
+        if cached is not None:
             return cached
 
-        url = "https://min-api.cryptocompare.com/data/v2/histoday"
-        params = {"fsym": coin_symbol.upper(), "tsym": "USD", "limit": days}
-        data = self._safe_request(url, params=params) or {}
+        def fetch():
+            url = "https://min-api.cryptocompare.com/data/v2/histoday"
+            params = {"fsym": coin_symbol.upper(), "tsym": "USD", "limit": days}
+            data = self._safe_request(url, params=params) or {}
 
-        prices, market_caps, total_volumes = [], [], []
-        try:
-            for item in data.get("Data", {}).get("Data", []):
-                ts = item.get("time", 0) * 1000
-                prices.append([ts, item.get("close", 0)])
-                market_caps.append([ts, item.get("volumefrom", 0) * item.get("close", 0)])
-                total_volumes.append([ts, item.get("volumeto", 0)])
-        except Exception as e:
-            logger.error(f"Error processing historical data for {coin_symbol}: {e}")
+            prices, market_caps, total_volumes = [], [], []
+            try:
+                items = data.get("Data", {}).get("Data", []) or []
+                # Read each candle once, then build the three series with comprehensions
+                candles = [
+                    (item.get("time", 0) * 1000, item.get("close", 0),
+                     item.get("volumefrom", 0), item.get("volumeto", 0))
+                    for item in items
+                ]
+                prices = [[ts, close] for ts, close, _, _ in candles]
+                market_caps = [[ts, vol_from * close] for ts, close, vol_from, _ in candles]
+                total_volumes = [[ts, vol_to] for ts, _, _, vol_to in candles]
+            except Exception as e:
+                logger.error(f"Error processing historical data for {coin_symbol}: {e}")
+
+            result = {
+                "prices": prices,
+                "market_caps": market_caps,
+                "total_volumes": total_volumes,
+                # Latest close, so chart renders don't need a separate price lookup
+                "current_price": prices[-1][1] if prices else None,
+            }
+            self._set_cache(cache_key, result, ttl=None if prices else self._negative_ttl)
+            return result
 
-        result = {"prices": prices, "market_caps": market_caps, "total_volumes": total_volumes}
-        self._set_cache(cache_key, result)
-        return result
+        return self._coalesce(cache_key, fetch)
 
     # ----------- Converter (Exchange Rates) -----------
     def get_exchange_rates(self) -> Dict:
         cache_key = "exchange_rates"
         cached = self._get_cache(cache_key)
-        if cached:
+        if cached is not None:
             return cached
 
-        crypto_prices = self.get_coin_prices(["bitcoin", "ethereum", "binancecoin", "cardano", "solana"], "usd")
-        fiat_data = self._safe_request("https://api.exchangerate.host/latest?base=USD") or {}
-        rates = fiat_data.get("rates", {})
-
-        result = {}
-        for coin in ["bitcoin", "ethereum", "binancecoin", "cardano", "solana"]:
-            usd = crypto_prices.get(coin, {}).get("usd")
-            if usd is None:
-                logger.warning(f"Unable to get USD price for {coin}")
-                continue
-            result[coin] = {
-                "usd": usd,
-                "eur": round(usd * rates.get("EUR", 1), 4),
-                "gbp": round(usd * rates.get("GBP", 1), 4),
-                "jpy": round(usd * rates.get("JPY", 1), 2),
-            }
+        def fetch():
+            coins = ["bitcoin", "ethereum", "binancecoin", "cardano", "solana"]
+
+            # Crypto prices and fiat rates come from different hosts; fetch both at once
+            crypto_prices, fiat_data = self.gather(
+                lambda: self.get_coin_prices(coins, "usd"),
+                lambda: self._safe_request("https://api.exchangerate.host/latest?base=USD"))
+            rates = (fiat_data or {}).get("rates", {})
 
-        self._set_cache(cache_key, result)
-        return result
+            # One broadcast multiply converts every coin to every fiat at once
+            usd_prices = np.array(
+                [crypto_prices.get(coin, {}).get("usd", np.nan) for coin in coins], dtype=np.float64)
+            fiat_rates = np.array(
+                [rates.get("EUR", 1), rates.get("GBP", 1), rates.get("JPY", 1)], dtype=np.float64)
+            converted = usd_prices[:, None] * fiat_rates[None, :]
+            converted[:, :2] = np.round(converted[:, :2], 4)
+            converted[:, 2] = np.round(converted[:, 2], 2)
+
+            result = {}
+            for i, coin in enumerate(coins):
+                if np.isnan(usd_prices[i]):
+                    logger.warning(f"Unable to get USD price for {coin}")
+                    continue
+                result[coin] = {
+                    "usd": crypto_prices[coin]["usd"],
+                    "eur": float(converted[i, 0]),
+                    "gbp": float(converted[i, 1]),
+                    "jpy": float(converted[i, 2]),
+                }
+
+            self._set_cache(cache_key, result, ttl=None if result else self._negative_ttl)
+            return result
+
+        return self._coalesce(cache_key, fetch)
 
     # ----------- Other Methods -----------
     def get_nfts_by_wallet(self, wallet_address: str, chain: str = "ethereum") -> List[Dict]:
         if not self.opensea_api_key:
             logger.warning("OpenSea API key missing. Set OPENSEA_API_KEY.")
             return []
-        url = f"{self.opensea_base_url}/chain/{chain}/account/{wallet_address}/nfts"
-        headers = {"Accept": "application/json", "X-API-KEY": self.opensea_api_key}
-        data = self._safe_request(url, headers=headers)
-        return data.get("nfts", [])
+
+        # Short TTL: wallet contents are more volatile than market data
+        cache_key = f"nfts_{chain}_{wallet_address}"
+        cached = self._get_cache(cache_key)
+        if cached is not None:
+            return cached
+
+        def fetch():
+            url = f"{self.opensea_base_url}/chain/{chain}/account/{wallet_address}/nfts"
+            headers = {"Accept": "application/json", "X-API-KEY": self.opensea_api_key}
+            data = self._safe_request(url, headers=headers)
+            nfts = data.get("nfts", [])
+            self._set_cache(cache_key, nfts, ttl=60 if nfts else self._negative_ttl)
+            return nfts
+
+        return self._coalesce(cache_key, fetch)
 
     def get_cryptopanic_news(self, filter: str = "news", currencies: str = "BTC") -> List[Dict]:
         if not self.cryptopanic_api_key:
             logger.warning("CryptoPanic API key missing. Set CRYPTOPANIC_API_KEY.")
             return []
-        params = {"auth_token": self.cryptopanic_api_key, "filter": filter, "currencies": currencies}
-        data = self._safe_request(f"{self.cryptopanic_base_url}/posts/", params=params)
-        return data.get("results", [])
+
+        # Short TTL: breaking news goes stale faster than market data
+        cache_key = f"cp_news_{filter}_{currencies}"
+        cached = self._get_cache(cache_key)
+        if cached is not None:
+            return cached
+
+        def fetch():
+            params = {"auth_token": self.cryptopanic_api_key, "filter": filter, "currencies": currencies}
+            data = self._safe_request(f"{self.cryptopanic_base_url}/posts/", params=params)
+            results = data.get("results", [])
+            self._set_cache(cache_key, results, ttl=60 if results else self._negative_ttl)
+            return results
+
+        return self._coalesce(cache_key, fetch)
+
+    @staticmethod
+    def _iter_rss_items(content: bytes, limit: int):
+        if lxml_etree is not None:
+            # Incremental C parse: stop early and free each <item> once consumed
+            count = 0
+            for _, item in lxml_etree.iterparse(BytesIO(content), tag='item'):
+                yield item
+                item.clear()
+                count += 1
+                if count >= limit:
+                    break
+        else:
+            # iterfind is lazy; islice stops it after the first `limit` items
+            root = ET.fromstring(content)
+            yield from islice(root.iterfind('.//item'), limit)
+
+    def _fetch_rss(self, rss_url: str, per_feed_limit: int) -> List[Dict]:
+        articles = []
+        try:
+            previous = self._rss_validators.get(rss_url)
+            headers = self._conditional_headers(previous[0], previous[1]) if previous else None
+            with self._host_sems[urlparse(rss_url).netloc]:
+                resp = self._session.get(rss_url, timeout=5, headers=headers)
+            if resp.status_code == 304 and previous:
+                # Feed unchanged since last fetch; reuse the parsed articles
+                return previous[2]
+            if resp.status_code != 200:
+                return articles
+            for item in self._iter_rss_items(resp.content, per_feed_limit):
+                title = item.find('title')
+                link = item.find('link')
+                description = item.find('description')
+                pub_date = item.find('pubDate')
+                article = {
+                    'title': _clean_text(title.text) if title is not None else 'No title',
+                    'url': link.text.strip() if link is not None else '',
+                    'description': _clean_text(description.text) if description is not None else '',
+                    'published_at': pub_date.text.strip() if pub_date is not None else '',
+                    'domain': rss_url.split('/')[2]
+                }
+                articles.append(article)
+            self._rss_validators[rss_url] = (
+                resp.headers.get("ETag"), resp.headers.get("Last-Modified"), articles)
+        except Exception as e:
+            logger.warning(f"Error parsing RSS {rss_url}: {e}")
+        return articles
 
     def get_crypto_news(self, limit: int = 20) -> List[Dict]:
         cache_key = f"crypto_news_{limit}"
         cached = self._get_cache(cache_key)
-        if cached:
+        if cached is not None:
             return cached
 
-        rss_urls = [
-            'https://feeds.feedburner.com/coindesk/CoinDesk',
-            'https://cointelegraph.com/rss',
-            'https://decrypt.co/feed'
-        ]
-        all_articles = []
+        def fetch():
+            rss_urls = [
+                'https://feeds.feedburner.com/coindesk/CoinDesk',
+                'https://cointelegraph.com/rss',
+                'https://decrypt.co/feed'
+            ]
+            per_feed_limit = limit // len(rss_urls)
 
-        for rss_url in rss_urls:
-            try:
-                resp = requests.get(rss_url, timeout=5)
-                if resp.status_code != 200:
-                    continue
-                root = ET.fromstring(resp.content)
-                for item in root.findall('.//item')[: limit // len(rss_urls)]:
-                    title = item.find('title')
-                    link = item.find('link')
-                    description = item.find('description')
-                    pub_date = item.find('pubDate')
-                    article = {
-                        'title': html.unescape(title.text.strip()) if title is not None else 'No title',
-                        'url': link.text.strip() if link is not None else '',
-                        'description': html.unescape(description.text.strip()) if description is not None else '',
-                        'published_at': pub_date.text.strip() if pub_date is not None else '',
-                        'domain': rss_url.split('/')[2]
-                    }
-                    all_articles.append(article)
-            except Exception as e:
-                logger.warning(f"Error parsing RSS {rss_url}: {e}")
-        self._set_cache(cache_key, all_articles)
-        return all_articles[:limit]
+            # The feeds are independent, so fetch them in parallel and merge.
+            results = self.gather(*(partial(self._fetch_rss, url, per_feed_limit) for url in rss_urls))
+            all_articles = [article for feed_articles in results for article in feed_articles]
+
+            self._set_cache(cache_key, all_articles, ttl=None if all_articles else self._negative_ttl)
+            return all_articles
+
+        return self._coalesce(cache_key, fetch)[:limit]
 
     def get_fear_greed_index(self) -> Dict:
         cache_key = "fear_greed"
         cached = self._get_cache(cache_key)
-        if cached:
+        if cached is not None:
             return cached
 
-        data = self._safe_request(self.fear_greed_url)
-        result = data.get('data', [{}])[0] if data.get('data') else {}
-        self._set_cache(cache_key, result)
-        return result
+        def fetch():
+            data = self._safe_request(self.fear_greed_url)
+            result = data.get('data', [{}])[0] if data.get('data') else {}
+            self._set_cache(cache_key, result, ttl=None if result else self._negative_ttl)
+            return result
+
+        return self._coalesce(cache_key, fetch)
 
 # Global instance
 crypto_api = CryptoAPIService()
+atexit.register(crypto_api._executor.shutdown)
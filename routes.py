@@ -21,10 +21,12 @@ leaderboard_bp = Blueprint('leaderboard', __name__)
 # Main routes
 @main_bp.route('/')
 def index():
-    trending_coins = crypto_api.get_trending_coins()
-    top_coins = crypto_api.get_top_coins(limit=10)
-    fear_greed = crypto_api.get_fear_greed_index()
-    
+    # The three calls are independent; run them concurrently
+    trending_coins, top_coins, fear_greed = crypto_api.gather(
+        crypto_api.get_trending_coins,
+        lambda: crypto_api.get_top_coins(limit=10),
+        crypto_api.get_fear_greed_index)
+
     return render_template('index.html', 
                          trending_coins=trending_coins,
                          top_coins=top_coins,
@@ -98,11 +100,11 @@ def dashboard():
     else:
         order = 'market_cap_desc'
     
-    top_coins = crypto_api.get_top_coins(limit=50, page=page)
-    
     # Sort based on filter
-    if filter_type == 'price_change' and top_coins:
-        top_coins = sorted(top_coins, key=lambda x: x.get('price_change_percentage_24h', 0), reverse=True)
+    if filter_type == 'price_change':
+        top_coins = crypto_api.get_top_coins_sorted('price_change_percentage_24h', limit=50, page=page)
+    else:
+        top_coins = crypto_api.get_top_coins(limit=50, page=page)
     
     return render_template('dashboard.html', 
                          top_coins=top_coins,
@@ -121,12 +123,10 @@ def charts():
     coin_id = request.args.get('coin', 'bitcoin')
     days = request.args.get('days', 30, type=int)
     
-    # Get historical data
+    # The history response already carries the latest close, so one call covers both
     historical_data = crypto_api.get_coin_history(coin_id, days)
-    
-    # Get current coin info
-    coin_prices = crypto_api.get_coin_prices([coin_id])
-    coin_info = coin_prices.get(coin_id, {}) if coin_prices else {}
+    current_price = historical_data.get('current_price')
+    coin_info = {'usd': current_price} if current_price is not None else {}
     
     return render_template('charts.html', 
                          historical_data=historical_data,
@@ -173,16 +173,16 @@ def convert():
 def leaderboard():
     sort_by = request.args.get('sort', '24h_change')
     
-    top_coins = crypto_api.get_top_coins(limit=100)
-    
-    if top_coins:
-        if sort_by == '24h_change':
-            top_coins = sorted(top_coins, key=lambda x: x.get('price_change_percentage_24h', 0), reverse=True)
-        elif sort_by == '7d_change':
-            top_coins = sorted(top_coins, key=lambda x: x.get('price_change_percentage_7d_in_currency', 0), reverse=True)
-        elif sort_by == 'volume':
-            top_coins = sorted(top_coins, key=lambda x: x.get('total_volume', 0), reverse=True)
+    sort_fields = {
+        '24h_change': 'price_change_percentage_24h',
+        '7d_change': 'price_change_percentage_7d_in_currency',
+        'volume': 'total_volume',
+    }
+    if sort_by in sort_fields:
+        top_coins = crypto_api.get_top_coins_sorted(sort_fields[sort_by], limit=100)
+    else:
         # Default is market cap (already sorted)
+        top_coins = crypto_api.get_top_coins(limit=100)
     
     return render_template('leaderboard.html', 
                          top_coins=top_coins[:50],  # Show top 50